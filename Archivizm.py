@@ -1,23 +1,50 @@
 import os
 import sys
+import csv
 import json
 import psutil
 from psutil._common import bytes2human
 import platform
+import time
 import hashlib
+import shutil
+import sqlite3
+try:
+    import blake3
+except ImportError:
+    # Fall back to the standard library when the blake3 package is not installed
+    blake3 = None
+try:
+    from rapidfuzz import fuzz, process as fuzzy_process, utils as fuzzy_utils
+except ImportError:
+    # Without RapidFuzz only identical column names are matched lexically
+    fuzz = None
+try:
+    import ijson
+except ImportError:
+    # Fall back to parsing the whole Siegfried report with json
+    ijson = None
 import concurrent.futures
-import pandas as pd
-import spacy
-from PyQt5.QtCore import QTimer, QThread, pyqtSignal
+import multiprocessing
+import functools
+import operator
+import itertools
+import threading
+from collections import Counter, defaultdict
+from PyQt5.QtCore import QTimer, QThread, pyqtSignal, Qt, QAbstractTableModel, QModelIndex
 from PyQt5.QtGui import QFont
 from PyQt5.QtWidgets import (
     QApplication, QMainWindow, QWidget, QPushButton, QVBoxLayout, QHBoxLayout,
-    QLabel, QTabWidget, QTableWidget, QTableWidgetItem, QTextEdit, QFileDialog,
+    QLabel, QTabWidget, QTableWidget, QTableWidgetItem, QTableView, QTextEdit, QFileDialog,
     QComboBox, QProgressBar, QLineEdit, QDialog, QCheckBox, QDialogButtonBox,
     QHeaderView, QMessageBox, QSizePolicy
 )
 import subprocess
-import tempfile
+import select
+import socket
+import atexit
+import urllib.parse
+import urllib.request
 from matplotlib.backends.backend_qt5agg import FigureCanvasQTAgg as FigureCanvas
 import matplotlib.pyplot as plt
 from matplotlib.figure import Figure
@@ -25,7 +52,262 @@ from matplotlib.figure import Figure
 # Set default font size for the application
 DEFAULT_FONT_SIZE = 10
 
+# Partition sizes are formatted again on every monitor refresh but rarely change, so the
+# formatted strings are cached
+bytes2human = functools.lru_cache(maxsize=256)(bytes2human)
+
+# spaCy model used to match exported keys to spreadsheet columns. Only word vectors are
+# needed for similarity, so the medium model is enough and the pipeline components are skipped.
+SPACY_MODEL = "en_core_web_md"
+SPACY_EXCLUDED_PIPES = ["tok2vec", "tagger", "parser", "attribute_ruler", "lemmatizer", "ner", "senter"]
+
+# RapidFuzz score (0-1) at which a key is matched to a column by name alone, without spaCy
+FUZZY_MATCH_THRESHOLD = 0.9
+
+# Number of files Siegfried identifies in parallel when it is run from the command line
+SIEGFRIED_MULTI = 16
+
+# Pseudo-filesystem directories that scans never descend into
+SKIPPED_DIRECTORIES = frozenset({"/proc", "/sys", "/dev", "/run"})
+
+# Read size used when hashing files for duplicate detection
+HASH_CHUNK_SIZE = 1024 * 1024
+# Leading bytes hashed to tell apart same-size files before hashing them in full
+PARTIAL_HASH_SIZE = 64 * 1024
+# Below this many files to hash, worker threads are used, as process startup would dominate
+PROCESS_POOL_MIN_FILES = 1000
+# Minimum time between two duplicate-scan progress updates, in seconds
+PROGRESS_INTERVAL = 0.02
+# Files smaller than this are hashed from a single read call
+SINGLE_READ_MAX_SIZE = 64 * 1024
+# Files up to this size have read-ahead queued for the whole file before hashing
+READ_AHEAD_MAX_SIZE = 256 * 1024 * 1024
+
 CONFIG_FILE = "config.json"
+HASH_CACHE_FILE = "hash_cache.db"  # Full file hashes kept between duplicate scans
+SAVE_DELAY_MS = 100  # Delay before configuration changes are written, in milliseconds
+
+class PartitionCache:
+    """
+    Short-lived cache of the system's disk partitions.
+
+    psutil.disk_partitions() re-reads the mount table on every call. On Linux the list is
+    only fetched again when the kernel reports a mount table change; elsewhere it is reused
+    for a couple of seconds instead of being fetched again on every refresh.
+    Every part of the application that needs the partition list goes through this cache.
+    """
+
+    TTL = 2.0  # Seconds before the partition list is fetched again
+    MOUNTS_FILE = "/proc/self/mounts"
+    _timestamp = 0.0
+    _partitions = []
+    _by_device = {}
+    _all_timestamp = None
+    _all_mountpoints = []
+    _mounts_file = None
+    _mounts_poll = None
+
+    @classmethod
+    def mounts_changed(cls):
+        """
+        Checks whether filesystems were mounted or unmounted since the last check.
+
+        The mtime of /proc/self/mounts never changes, but polling the open file reports
+        POLLPRI once after every change to the mount table, without reading it.
+
+        @return: True or False, or None if change notification is not available.
+        """
+        if cls._mounts_poll is None:
+            try:
+                cls._mounts_file = open(cls.MOUNTS_FILE, "rb")
+                cls._mounts_poll = select.poll()
+                cls._mounts_poll.register(cls._mounts_file, select.POLLPRI | select.POLLERR)
+            except (OSError, AttributeError):
+                # No /proc (or no poll) on this platform
+                cls._mounts_poll = False
+        if not cls._mounts_poll:
+            return None
+        return any(events & (select.POLLPRI | select.POLLERR) for _, events in cls._mounts_poll.poll(0))
+
+    @classmethod
+    def partitions(cls):
+        """
+        Returns the current disk partitions, re-reading them after a mount table change
+        or once the cache has expired.
+
+        Cached format scans are dropped whenever the mounts change, since a different
+        medium may now be mounted under the same device name and path.
+
+        @return: A list of psutil partition objects.
+        """
+        now = time.monotonic()
+        changed = cls.mounts_changed()
+        mounts_changed = bool(changed)
+        if changed is None:
+            changed = now - cls._timestamp > cls.TTL
+        if changed or not cls._timestamp:
+            partitions = psutil.disk_partitions()
+            if mounts_changed or partitions != cls._partitions:
+                DeviceInfoCollector.clear_scan_cache()
+            cls._partitions = partitions
+            cls._by_device = {partition.device: partition for partition in cls._partitions}
+            cls._timestamp = now
+        return cls._partitions
+
+    @classmethod
+    def all_mountpoints(cls):
+        """
+        Returns the mount points of all filesystems, including pseudo-filesystems such as
+        /proc that partitions() leaves out. They are re-read together with the partitions.
+
+        @return: A list of mount point paths.
+        """
+        cls.partitions()
+        if cls._all_timestamp != cls._timestamp:
+            try:
+                cls._all_mountpoints = [partition.mountpoint for partition in psutil.disk_partitions(all=True)]
+            except Exception:
+                cls._all_mountpoints = []
+            cls._all_timestamp = cls._timestamp
+        return cls._all_mountpoints
+
+    @classmethod
+    def get(cls, device):
+        """
+        Looks up a partition by its device path.
+
+        @param device: The device path (e.g., '/dev/sda1').
+        @return: The matching psutil partition object, or None if the device is not mounted.
+        """
+        cls.partitions()
+        return cls._by_device.get(device)
+
+    @classmethod
+    def mountpoint(cls, device):
+        """
+        Looks up where a device is mounted.
+
+        @param device: The device path (e.g., '/dev/sda1').
+        @return: The mount point, or None if the device is not mounted.
+        """
+        partition = cls.get(device)
+        return partition.mountpoint if partition else None
+
+class DiskIOCache:
+    """
+    Short-lived cache of per-disk I/O counters.
+
+    psutil.disk_io_counters(perdisk=True) parses the kernel's disk statistics for every disk
+    on each call, so the result is reused for a second when devices are viewed in quick
+    succession.
+    """
+
+    TTL = 1.0  # Seconds before the counters are fetched again
+    _timestamp = 0.0
+    _counters = {}
+
+    @classmethod
+    def counters(cls):
+        """
+        Returns the per-disk I/O counters, re-reading them once the cache has expired.
+
+        @return: A dictionary mapping disk names (e.g., 'sda1') to psutil I/O counter objects.
+        """
+        now = time.monotonic()
+        if now - cls._timestamp > cls.TTL:
+            cls._counters = psutil.disk_io_counters(perdisk=True) or {}
+            cls._timestamp = now
+        return cls._counters
+
+class SiegfriedServer:
+    """
+    Keeps one Siegfried process running in server mode for the whole session.
+
+    Each command-line run of Siegfried loads the PRONOM signature file before it can identify
+    anything, which dominates the cost of small and medium scans. The server loads the
+    signatures once and is then queried over HTTP on a local port. It is stopped on exit.
+    """
+
+    STARTUP_TIMEOUT = 10.0  # Seconds to wait for the server to accept connections
+    READ_TIMEOUT = 60.0  # Seconds to wait for the next chunk of a response
+    _process = None
+    _binary = None
+    _port = None
+    _lock = threading.Lock()
+
+    @classmethod
+    def url(cls, binary):
+        """
+        Returns the base URL of the Siegfried server, starting it on a free local port if needed.
+
+        @param binary: Path to the Siegfried executable.
+        @return: The base URL of the server, or None if it could not be started.
+        """
+        with cls._lock:
+            if cls._process is not None and cls._process.poll() is None and cls._binary == binary:
+                return f"http://127.0.0.1:{cls._port}"
+            cls.stop()
+
+            with socket.socket() as sock:
+                sock.bind(("127.0.0.1", 0))
+                port = sock.getsockname()[1]
+            try:
+                process = subprocess.Popen([binary, "-serve", f"127.0.0.1:{port}"],
+                                           stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL)
+            except OSError:
+                return None
+
+            # The port starts accepting connections once the signatures are loaded
+            deadline = time.monotonic() + cls.STARTUP_TIMEOUT
+            while process.poll() is None and time.monotonic() < deadline:
+                try:
+                    socket.create_connection(("127.0.0.1", port), timeout=0.5).close()
+                except OSError:
+                    time.sleep(0.05)
+                    continue
+                cls._process, cls._binary, cls._port = process, binary, port
+                return f"http://127.0.0.1:{port}"
+
+            if process.poll() is None:
+                process.kill()
+            process.wait()
+            return None
+
+    @classmethod
+    def identify(cls, binary, path, max_files):
+        """
+        Identifies the files under a path with the Siegfried server.
+
+        The whole directory is submitted in a single request so Siegfried walks and identifies
+        it itself; the streamed report is closed once max_files entries have been read.
+
+        @param binary: Path to the Siegfried executable.
+        @param path: The file or directory to identify.
+        @param max_files: Maximum number of file entries to read from the report.
+        @return: A tuple of (scanned file count, PRONOM format counts), or None if the server is unavailable.
+        """
+        base_url = cls.url(binary)
+        if base_url is None:
+            return None
+        request_url = f"{base_url}/identify/{urllib.parse.quote(path, safe='')}?format=json"
+        try:
+            with urllib.request.urlopen(request_url, timeout=cls.READ_TIMEOUT) as response:
+                return DeviceInfoCollector.count_pronom_formats(response, max_files)
+        except OSError:
+            return None
+
+    @classmethod
+    def stop(cls):
+        """
+        Stops the Siegfried server if it is running.
+        """
+        if cls._process is not None:
+            if cls._process.poll() is None:
+                cls._process.kill()
+            cls._process.wait()
+            cls._process = None
+
+atexit.register(SiegfriedServer.stop)
 
 class DeviceInfoCollector:
     """
@@ -36,6 +318,23 @@ class DeviceInfoCollector:
     or lightweight scanning.
     """
 
+    # Device type classification rules, checked in order. Each rule tests one lower-cased
+    # partition field: 0 = device path, 1 = filesystem type, 2 = mount options.
+    DEVICE_TYPE_RULES = (
+        ("CD/DVD", 2, str.__contains__, "cdrom"),
+        ("CD/DVD", 1, str.__contains__, "iso9660"),
+        ("CD/DVD", 1, str.__contains__, "cdfs"),
+        ("CD/DVD", 0, str.startswith, "/dev/sr"),
+        ("Floppy", 0, str.startswith, "/dev/fd"),
+        ("Zip Disk", 0, str.__contains__, "zip"),
+    )
+
+    # Format scan results by (scan path, signature, use_siegfried), oldest first
+    SCAN_CACHE_SIZE = 32
+    SCAN_CACHE_TTL = 60.0  # Seconds before a cached format scan is run again
+    _scan_cache = {}
+    _scan_cache_lock = threading.Lock()
+
     @staticmethod
     def collect_device_info(device, use_siegfried=True, directory=None):
         """
@@ -50,160 +349,450 @@ class DeviceInfoCollector:
         @param directory: Optional directory path to scan instead of the device's mountpoint.
         @return: A dictionary containing device information or None if the device is not found.
         """
+        partition = PartitionCache.get(device)
+        if partition is None:
+            return None
+
         device_info = {}
-        partitions = psutil.disk_partitions()
-        for partition in partitions:
-            if partition.device == device:
-                device_info["Mountpoint"] = partition.mountpoint
-                device_info["Filesystem Type"] = partition.fstype
-                device_info["Mount Options"] = partition.opts
-                device_type = DeviceInfoCollector.guess_device_type(partition)
-                device_info["Device Type"] = device_type
-
-                if device_type == "CD/DVD":
-                    device_info["Access Restrictions"] = "DVD Reader"
-                elif device_type == "Floppy":
-                    device_info["Access Restrictions"] = "Floppy Drive"
-                elif device_type == "Zip Disk":
-                    device_info["Access Restrictions"] = "Zip Disk"
+        device_info["Mountpoint"] = partition.mountpoint
+        device_info["Filesystem Type"] = partition.fstype
+        device_info["Mount Options"] = partition.opts
+        device_type = DeviceInfoCollector.guess_device_type(partition)
+        device_info["Device Type"] = device_type
+
+        if device_type == "CD/DVD":
+            device_info["Access Restrictions"] = "DVD Reader"
+        elif device_type == "Floppy":
+            device_info["Access Restrictions"] = "Floppy Drive"
+        elif device_type == "Zip Disk":
+            device_info["Access Restrictions"] = "Zip Disk"
+
+        # One statvfs call serves both the usage figures and the filesystem statistics
+        try:
+            statvfs = os.statvfs(partition.mountpoint)
+        except Exception:
+            statvfs = None
 
-                try:
-                    usage = psutil.disk_usage(partition.mountpoint)
-                    device_info["Total Size"] = bytes2human(usage.total)
-                    device_info["Used Size"] = bytes2human(usage.used)
-                    device_info["Free Size"] = bytes2human(usage.free)
-                    device_info["Usage Percent"] = f"{usage.percent}%"
-                except Exception:
-                    pass
+        try:
+            if statvfs is not None:
+                # Same figures psutil.disk_usage derives from its own statvfs call
+                total = statvfs.f_blocks * statvfs.f_frsize
+                free = statvfs.f_bavail * statvfs.f_frsize
+                used = total - statvfs.f_bfree * statvfs.f_frsize
+                percent = round(used / (used + free) * 100, 1) if used + free else 0.0
+            else:
+                usage = psutil.disk_usage(partition.mountpoint)
+                total, used, free, percent = usage.total, usage.used, usage.free, usage.percent
+            device_info["Total Size"] = bytes2human(total)
+            device_info["Used Size"] = bytes2human(used)
+            device_info["Free Size"] = bytes2human(free)
+            device_info["Usage Percent"] = f"{percent}%"
+        except Exception:
+            pass
 
-                try:
-                    statvfs = os.statvfs(partition.mountpoint)
-                    device_info["Filesystem Statistics"] = {
-                        "Block Size": f"{statvfs.f_frsize} bytes",
-                        "Total Blocks": statvfs.f_blocks,
-                        "Free Blocks": statvfs.f_bfree,
-                        "Available Blocks": statvfs.f_bavail,
-                        "Inodes Total": statvfs.f_files,
-                        "Inodes Free": statvfs.f_ffree,
-                        "Inodes Available": statvfs.f_favail
-                    }
-                except Exception:
-                    pass
+        if statvfs is not None:
+            device_info["Filesystem Statistics"] = {
+                "Block Size": f"{statvfs.f_frsize} bytes",
+                "Total Blocks": statvfs.f_blocks,
+                "Free Blocks": statvfs.f_bfree,
+                "Available Blocks": statvfs.f_bavail,
+                "Inodes Total": statvfs.f_files,
+                "Inodes Free": statvfs.f_ffree,
+                "Inodes Available": statvfs.f_favail
+            }
 
-                io_counters = psutil.disk_io_counters(perdisk=True)
-                device_key = partition.device.replace("/dev/", "")
-                if device_key in io_counters:
-                    counters = io_counters[device_key]
-                    device_info["Disk I/O Counters"] = {
-                        "Read Count": counters.read_count,
-                        "Read Bytes": bytes2human(counters.read_bytes),
-                        "Read Time": f"{counters.read_time} ms"
-                    }
+        io_counters = DiskIOCache.counters()
+        device_key = partition.device.replace("/dev/", "")
+        if device_key in io_counters:
+            counters = io_counters[device_key]
+            device_info["Disk I/O Counters"] = {
+                "Read Count": counters.read_count,
+                "Read Bytes": bytes2human(counters.read_bytes),
+                "Read Time": f"{counters.read_time} ms"
+            }
 
-                try:
-                    scan_path = directory if directory else partition.mountpoint
-                    items = os.listdir(scan_path)
-                    num_files = sum(1 for item in items if os.path.isfile(os.path.join(scan_path, item)))
-                    dir_count = sum(1 for item in items if os.path.isdir(os.path.join(scan_path, item)))
-                    device_info["Top-Level Content Overview"] = {"Files": num_files, "Directories": dir_count}
-                except Exception:
-                    pass
+        scan_path = directory if directory else partition.mountpoint
 
-                # File format identification
-                scan_path = directory if directory else partition.mountpoint
-                if scan_path and os.path.exists(scan_path):
-                    if use_siegfried:
-                        # Determine Siegfried binary based on OS
-                        os_name = platform.system().lower()
-                        if os_name == 'windows':
-                            binary_name = 'sf.exe'
-                        elif os_name == 'linux' or os_name == 'darwin':  # Darwin is macOS
-                            binary_name = 'sf'
-                        else:
-                            device_info["Siegfried Status"] = f"Unsupported OS: {os_name}"
-                            return device_info
+        signature = None
+        try:
+            num_files = 0
+            dir_count = 0
+            # The scan cache is invalidated when the scan path or any top-level directory
+            # changes, or a different filesystem is mounted there. Device number and
+            # filesystem ID tell media apart where mtimes cannot (vfat reports 0 for the root).
+            root_stat = os.stat(scan_path)
+            fsid = os.statvfs(scan_path).f_fsid if hasattr(os, "statvfs") else None
+            mtimes = [root_stat.st_mtime_ns]
+            # scandir exposes the entry type from the directory read, so no extra stat per item
+            with os.scandir(scan_path) as entries:
+                for entry in entries:
+                    if entry.is_file():
+                        num_files += 1
+                    elif entry.is_dir():
+                        dir_count += 1
+                        mtimes.append(entry.stat().st_mtime_ns)
+            device_info["Top-Level Content Overview"] = {"Files": num_files, "Directories": dir_count}
+            signature = (root_stat.st_dev, fsid, num_files, tuple(mtimes))
+        except Exception:
+            pass
 
-                        siegfried_path = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'Siegfried', binary_name)
-                        if not os.path.exists(siegfried_path):
-                            device_info["Siegfried Status"] = f"Siegfried binary '{binary_name}' not found at {siegfried_path}"
-                            return device_info
-                        if not os.access(siegfried_path, os.X_OK):
-                            device_info["Siegfried Status"] = f"Siegfried binary '{binary_name}' at {siegfried_path} is not executable"
-                            return device_info
+        # File format identification, reused while the top of the tree is unchanged
+        if scan_path and os.path.exists(scan_path):
+            try:
+                device_info.update(DeviceInfoCollector.cached_scan_formats(scan_path, signature, use_siegfried))
+            except Exception as e:
+                if use_siegfried:
+                    device_info["Siegfried Exception"] = str(e)
+                else:
+                    device_info["Lightweight Scan Error"] = str(e)
+        return device_info
+
+    @classmethod
+    def cached_scan_formats(cls, scan_path, signature, use_siegfried=True):
+        """
+        Runs scan_formats, reusing an earlier result for the same scan path and signature.
+
+        Viewing an unchanged device again skips the walk and the identification. The signature
+        only covers the top of the tree, so files added or removed further down are not
+        noticed; results therefore expire after SCAN_CACHE_TTL seconds. Exceptions, empty
+        results and results with a Siegfried error or status are not cached, so a transient
+        failure is retried on the next view. Nothing is cached without a signature.
+
+        @param scan_path: The directory to scan.
+        @param signature: A value that changes when the directory tree changes, such as
+            the modification times of its top-level directories, or None.
+        @param use_siegfried: Boolean indicating whether to use Siegfried for file format identification.
+        @return: A dictionary of scan results to merge into the device information.
+        """
+        key = (scan_path, signature, use_siegfried)
+        now = time.monotonic()
+        if signature is not None:
+            with cls._scan_cache_lock:
+                cached = cls._scan_cache.get(key)
+                if cached is not None:
+                    timestamp, results = cached
+                    if now - timestamp <= cls.SCAN_CACHE_TTL:
+                        return results
+                    del cls._scan_cache[key]
+        results = cls.scan_formats(scan_path, use_siegfried)
+        if (signature is not None and results
+                and "Siegfried Error" not in results and "Siegfried Status" not in results):
+            with cls._scan_cache_lock:
+                cls._scan_cache.pop(key, None)
+                if len(cls._scan_cache) >= cls.SCAN_CACHE_SIZE:
+                    cls._scan_cache.pop(next(iter(cls._scan_cache)))
+                cls._scan_cache[key] = (now, results)
+        return results
+
+    @classmethod
+    def clear_scan_cache(cls):
+        """
+        Drops all cached format scan results.
+        """
+        with cls._scan_cache_lock:
+            cls._scan_cache.clear()
 
+    @staticmethod
+    def scan_formats(scan_path, use_siegfried=True):
+        """
+        Identifies the file formats under a path with Siegfried or by file extension.
+
+        @param scan_path: The directory to scan.
+        @param use_siegfried: Boolean indicating whether to use Siegfried for file format identification.
+        @return: A dictionary of scan results to merge into the device information.
+        """
+        results = {}
+        if use_siegfried:
+            # Determine Siegfried binary based on OS
+            os_name = platform.system().lower()
+            if os_name == 'windows':
+                binary_name = 'sf.exe'
+            elif os_name == 'linux' or os_name == 'darwin':  # Darwin is macOS
+                binary_name = 'sf'
+            else:
+                results["Siegfried Status"] = f"Unsupported OS: {os_name}"
+                return results
+
+            siegfried_path = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'Siegfried', binary_name)
+            if not os.path.exists(siegfried_path):
+                results["Siegfried Status"] = f"Siegfried binary '{binary_name}' not found at {siegfried_path}"
+                return results
+            if not os.access(siegfried_path, os.X_OK):
+                results["Siegfried Status"] = f"Siegfried binary '{binary_name}' at {siegfried_path} is not executable"
+                return results
+
+            max_files = 20000
+
+            # Siegfried walks a directory itself and would follow it into pseudo-filesystems and
+            # other mounts, so such trees are collected with walk_files and passed as a path list
+            file_paths = None
+            if DeviceInfoCollector.contains_mounts(scan_path):
+                file_paths = [entry.path for entry in DeviceInfoCollector.walk_files(scan_path, max_files)]
+                if not file_paths:
+                    results["Siegfried Status"] = "No files found to scan"
+                    return results
+                result = None
+            else:
+                # Prefer the long-running server, which has its signatures loaded already
+                result = SiegfriedServer.identify(siegfried_path, scan_path, max_files)
+            if result is None:
+                # Otherwise run Siegfried once on the directory or path list; it identifies files
+                # in parallel and is stopped once max_files have been reported
+                feeder = None
+                if file_paths is not None:
+                    # contains_mounts only reports mounts on POSIX, so the list can always be
+                    # piped in. It is written from a thread so a full stdout pipe cannot block it.
+                    cmd = [siegfried_path, '-multi', str(SIEGFRIED_MULTI), '-json', '-f', '/dev/stdin']
+                    proc = subprocess.Popen(cmd, stdin=subprocess.PIPE, stdout=subprocess.PIPE, stderr=subprocess.PIPE)
+                    feeder = threading.Thread(target=DeviceInfoCollector.write_paths,
+                                              args=(proc.stdin, file_paths), daemon=True)
+                    feeder.start()
+                else:
+                    cmd = [siegfried_path, '-multi', str(SIEGFRIED_MULTI), '-json', scan_path]
+                    proc = subprocess.Popen(cmd, stdout=subprocess.PIPE, stderr=subprocess.PIPE)
+                # stderr is drained on its own thread, so sf never blocks writing to it while
+                # its report is read from stdout
+                stderr_chunks = []
+                stderr_reader = threading.Thread(target=lambda: stderr_chunks.append(proc.stderr.read()), daemon=True)
+                stderr_reader.start()
+                scanned_files = 0
+                formats = {}
+                parse_error = None
+                stopped = False
+                try:
+                    try:
+                        scanned_files, formats = DeviceInfoCollector.count_pronom_formats(proc.stdout, max_files)
+                    except Exception as e:
+                        parse_error = e
+                    if scanned_files >= max_files:
+                        stopped = True
+                    elif parse_error is not None:
+                        # A failing sf exits by itself; one still writing a report nobody
+                        # reads any more would block on the full pipe, so it is stopped
                         try:
-                            # Collect up to 20000 file paths
-                            max_files = 20000
-                            count = 0
-                            file_paths = []
-                            for root, _, files in os.walk(scan_path):
-                                for file in files:
-                                    count += 1
-                                    full_path = os.path.join(root, file)
-                                    file_paths.append(full_path)
-                                    if count >= max_files:
-                                        break
-                                if count >= max_files:
-                                    break
-
-                            if file_paths:
-                                with tempfile.NamedTemporaryFile(mode='w', delete=False, encoding='utf-8') as temp:
-                                    temp.write('\n'.join(file_paths))
-                                temp_path = temp.name
-
-                                cmd = [siegfried_path, '-json', '-f', temp_path]
-                                result = subprocess.run(cmd, capture_output=True, text=True)
-                                if result.returncode != 0:
-                                    device_info["Siegfried Error"] = f"Command failed with return code {result.returncode}: {result.stderr}"
-                                    os.unlink(temp_path)
-                                    return device_info
-                                    
-                                json_data = json.loads(result.stdout)
-                                
-                                formats = {}
-                                scanned_files = len(json_data.get('files', []))
-                                for file_entry in json_data.get('files', []):
-                                    for match in file_entry.get('matches', []):
-                                        if match.get('ns') == 'pronom':
-                                            fmt = match.get('id')
-                                            formats[fmt] = formats.get(fmt, 0) + 1
-                                            break
-                                
-                                os.unlink(temp_path)
-                                
-                                if formats:
-                                    device_info["Scanned Files"] = scanned_files
-                                    device_info["File Formats"] = formats
-                            else:
-                                device_info["Siegfried Status"] = "No files found to scan"
-                        except Exception as e:
-                            device_info["Siegfried Exception"] = str(e)
+                            proc.wait(timeout=1)
+                        except subprocess.TimeoutExpired:
+                            stopped = True
+                    if stopped:
+                        proc.terminate()
+                        proc.wait(timeout=5)
                     else:
-                        # Lightweight file type scanning
-                        try:
-                            file_types = {}
-                            count = 0
-                            max_files = 20000
-                            
-                            for root, _, files in os.walk(scan_path):
-                                for file in files:
-                                    count += 1
-                                    ext = os.path.splitext(file)[1].lower()
-                                    if ext == '':
-                                        ext = 'no_extension'
-                                    file_types[ext] = file_types.get(ext, 0) + 1
-                                    
-                                    if count >= max_files:
-                                        break
-                                if count >= max_files:
-                                    break
-                            
-                            device_info["Scanned Files"] = count
-                            device_info["File Types"] = file_types
-                        except Exception as e:
-                            device_info["Lightweight Scan Error"] = str(e)
-                return device_info
-        return None
+                        proc.wait()
+                except subprocess.TimeoutExpired:
+                    pass
+                finally:
+                    if proc.poll() is None:
+                        proc.kill()
+                        proc.wait()
+                    stderr_reader.join()
+                    if feeder is not None:
+                        feeder.join()
+                    proc.stdout.close()
+                    proc.stderr.close()
+                stderr = b''.join(stderr_chunks)
+
+                if not stopped and proc.returncode != 0:
+                    results["Siegfried Error"] = f"Command failed with return code {proc.returncode}: {stderr.decode(errors='replace')}"
+                    return results
+                if parse_error is not None:
+                    raise parse_error
+                result = scanned_files, formats
+
+            scanned_files, formats = result
+            if formats:
+                results["Scanned Files"] = scanned_files
+                results["File Formats"] = formats
+            elif not scanned_files:
+                results["Siegfried Status"] = "No files found to scan"
+        else:
+            # Lightweight file type scanning
+            max_files = 20000
+
+            files = DeviceInfoCollector.walk_files(scan_path, max_files)
+
+            # Counter tallies the extensions in C; file_extension returns interned strings,
+            # so repeated extensions share one object and hash once. A plain dict is returned
+            # so exported cells keep their format.
+            file_types = dict(Counter(DeviceInfoCollector.file_extension(entry.name) for entry in files))
+
+            results["Scanned Files"] = len(files)
+            results["File Types"] = file_types
+        return results
+
+    @staticmethod
+    def count_pronom_formats(stream, max_files=None):
+        """
+        Counts the PRONOM format of each file entry in a Siegfried JSON report.
+
+        The report is parsed one file entry at a time instead of building the whole document
+        in memory; only the first PRONOM match of each file is counted.
+
+        @param stream: A binary file-like object containing the JSON report.
+        @param max_files: Optional maximum number of file entries to read.
+        @return: A tuple of (scanned file count, dictionary mapping PRONOM IDs to counts).
+        """
+        if ijson is not None:
+            file_entries = ijson.items(stream, 'files.item')
+        else:
+            file_entries = json.load(stream).get('files', [])
+
+        scanned_files = 0
+
+        def pronom_ids():
+            nonlocal scanned_files
+            for file_entry in itertools.islice(file_entries, max_files):
+                scanned_files += 1
+                for match in file_entry.get('matches') or []:
+                    if match.get('ns') == 'pronom':
+                        yield match.get('id')
+                        break
+
+        # Counter tallies the stream of IDs in C; a plain dict is returned so exported
+        # cells keep their format
+        formats = dict(Counter(pronom_ids()))
+        return scanned_files, formats
+
+    @staticmethod
+    def file_extension(name):
+        """
+        Returns the lowercase extension of a file name.
+
+        Finds the last dot with str.rfind, so unlike os.path.splitext no tuple or stem string
+        is built. As with splitext, leading dots mark a hidden file, not an extension, so
+        '.bashrc', '..foo' and '...' have none while '.config.yml' has '.yml'.
+
+        @param name: The file name, without directory components.
+        @return: The interned extension including its dot (e.g., '.pdf'), or 'no_extension'.
+        """
+        dot = name.rfind('.')
+        # A dot only starts an extension if something other than dots comes before it
+        if dot > 0 and (name[0] != '.' or name[:dot].lstrip('.')):
+            return DeviceInfoCollector.normalize_extension(name[dot:])
+        return 'no_extension'
+
+    @staticmethod
+    @functools.lru_cache(maxsize=1024)
+    def normalize_extension(suffix):
+        """
+        Lowercases and interns a raw file suffix.
+
+        Cached by the suffix as found, so each distinct spelling is lowercased and interned once.
+
+        @param suffix: The suffix including its dot, in its original case.
+        @return: The interned lowercase suffix.
+        """
+        return sys.intern(suffix.lower())
+
+    @staticmethod
+    def device_of(entry):
+        """
+        Returns the device number of a directory entry without following symlinks.
+
+        @param entry: An os.DirEntry object.
+        @return: The st_dev of the entry, or None if it cannot be read.
+        """
+        try:
+            return entry.stat(follow_symlinks=False).st_dev
+        except OSError:
+            return None
+
+    @staticmethod
+    def write_paths(pipe, file_paths):
+        """
+        Writes a newline-separated list of file paths to a pipe and closes it.
+
+        Paths are encoded with os.fsencode, so names that are not valid UTF-8 reach Siegfried unchanged.
+
+        @param pipe: The binary pipe to write to, such as a process's stdin.
+        @param file_paths: The file paths to write.
+        """
+        try:
+            with pipe:
+                pipe.write(b'\n'.join(map(os.fsencode, file_paths)))
+        except OSError:
+            # The reader exited early; its exit status is reported by the caller
+            pass
+
+    @staticmethod
+    def contains_mounts(path):
+        """
+        Checks whether another mount or a pseudo-filesystem such as /proc lies below a directory.
+
+        Only POSIX mount points are checked; on other systems this always returns False.
+
+        @param path: The directory to check.
+        @return: True if a walk of the directory could cross into another filesystem.
+        """
+        if os.name != 'posix':
+            return False
+        root = os.path.realpath(path)
+        prefix = os.path.join(root, '')
+        if any(directory.startswith(prefix) for directory in SKIPPED_DIRECTORIES):
+            return True
+        return any(mountpoint != root and mountpoint.startswith(prefix)
+                   for mountpoint in PartitionCache.all_mountpoints())
+
+    @staticmethod
+    def walk_files(path, max_files, workers=4):
+        """
+        Collects up to max_files files under a directory using a pool of walker threads.
+
+        The tree is walked breadth-first, one level at a time. The directories of a level are
+        listed in parallel with os.scandir (which releases the GIL and reuses the cached
+        directory entry type), and their results are combined in sorted order, so the files
+        kept when the limit is reached are the same on every run. Like os.walk, symlinked
+        directories are not followed and unreadable directories are skipped. Four workers
+        keep the parallelism without contending on per-volume locks.
+        On POSIX systems the walk stays on the filesystem of the starting directory and never
+        enters pseudo-filesystems such as /proc, so scanning '/' does not descend into them.
+
+        @param path: The directory to walk.
+        @param max_files: Maximum number of files to collect.
+        @param workers: Number of walker threads.
+        @return: A list of os.DirEntry objects for at most max_files non-directory entries.
+        """
+        # DirEntry.stat() reports no device number on Windows, so mount boundaries are only checked on POSIX
+        try:
+            root_device = os.stat(path).st_dev if os.name == 'posix' else None
+        except OSError:
+            return []
+
+        def list_directory(directory):
+            subdirs = []
+            found = []
+            try:
+                with os.scandir(directory) as entries:
+                    for entry in entries:
+                        if entry.is_dir():
+                            if entry.is_symlink() or entry.path in SKIPPED_DIRECTORIES:
+                                continue
+                            if root_device is not None and DeviceInfoCollector.device_of(entry) != root_device:
+                                continue
+                            subdirs.append(entry.path)
+                        else:
+                            found.append(entry)
+            except OSError:
+                pass
+            subdirs.sort()
+            found.sort(key=operator.attrgetter('name'))
+            return subdirs, found
+
+        files = []
+        level = [path]
+        # Directories are listed in batches, so little work is wasted once the limit is hit
+        batch_size = workers * 8
+        with concurrent.futures.ThreadPoolExecutor(max_workers=workers) as executor:
+            while level and len(files) < max_files:
+                next_level = []
+                for start in range(0, len(level), batch_size):
+                    for subdirs, found in executor.map(list_directory, level[start:start + batch_size]):
+                        files.extend(found)
+                        next_level.extend(subdirs)
+                    if len(files) >= max_files:
+                        break
+                level = next_level
+
+        return files[:max_files]
 
     @staticmethod
     def guess_device_type(partition):
@@ -216,16 +805,25 @@ class DeviceInfoCollector:
         @param partition: A psutil partition object containing device details.
         @return: A string indicating the device type (e.g., 'CD/DVD', 'Regular Storage').
         """
-        device_lower = partition.device.lower()
-        fstype_lower = partition.fstype.lower()
-        opts_lower = partition.opts.lower()
-        if "cdrom" in opts_lower or "iso9660" in fstype_lower or "cdfs" in fstype_lower or device_lower.startswith("/dev/sr"):
-            return "CD/DVD"
-        elif device_lower.startswith("/dev/fd"):
-            return "Floppy"
-        elif "zip" in device_lower:
-            return "Zip Disk"
-        return "Regular Storage"
+        return DeviceInfoCollector.classify_device(partition.device, partition.fstype, partition.opts)
+
+    @staticmethod
+    @functools.lru_cache(maxsize=64)
+    def classify_device(device, fstype, opts):
+        """
+        Applies DEVICE_TYPE_RULES to a partition's attributes.
+
+        Cached by the attribute values, so a partition seen before is classified without
+        lowering its strings or running the rules again.
+
+        @param device: The device path.
+        @param fstype: The filesystem type.
+        @param opts: The mount options.
+        @return: A string indicating the device type.
+        """
+        fields = (device.lower(), fstype.lower(), opts.lower())
+        return next((device_type for device_type, field, match, pattern in DeviceInfoCollector.DEVICE_TYPE_RULES
+                     if match(fields[field], pattern)), "Regular Storage")
 
 class ConfigManager:
     """
@@ -240,11 +838,19 @@ class ConfigManager:
         Initializes the ConfigManager with a specified configuration file.
 
         Loads the configuration from the file or initializes with default settings
-        if the file does not exist or is corrupted.
+        if the file does not exist or is corrupted. Changes made through the setters are
+        written shortly afterwards, and any pending change is written when the application quits.
 
         @param config_file: The path to the configuration JSON file.
         """
         self.config_file = config_file
+        self.save_timer = QTimer()
+        self.save_timer.setSingleShot(True)
+        self.save_timer.setInterval(SAVE_DELAY_MS)
+        self.save_timer.timeout.connect(self.save_config)
+        app = QApplication.instance()
+        if app is not None:
+            app.aboutToQuit.connect(self.flush)
         self.default_config = {
             "working_directory": None,
             "duplicates_table_columns": {
@@ -266,8 +872,8 @@ class ConfigManager:
         """
         if os.path.exists(self.config_file):
             try:
-                with open(self.config_file, "r") as f:
-                    loaded_config = json.load(f)
+                with open(self.config_file, "rb") as f:
+                    loaded_config = json.loads(f.read())
                     # Merge with default config to ensure all keys exist
                     config = self.default_config.copy()
                     config.update(loaded_config)
@@ -285,16 +891,37 @@ class ConfigManager:
         """
         Saves configuration to the JSON file.
 
+        The configuration is written to a temporary file that then replaces the original,
+        so a crash mid-write can never leave a truncated config behind.
+
         @param config: Optional dictionary to save; if None, saves the current configuration.
         """
         if config is None:
             config = self.config
+        temp_path = self.config_file + ".tmp"
         try:
-            with open(self.config_file, "w") as f:
+            with open(temp_path, "w") as f:
                 json.dump(config, f, indent=4)
+            os.replace(temp_path, self.config_file)
         except Exception:
             pass
 
+    def schedule_save(self):
+        """
+        Saves the current configuration after a short delay.
+
+        Restarting the timer on every change coalesces a burst of setter calls into one write.
+        """
+        self.save_timer.start()
+
+    def flush(self):
+        """
+        Writes a pending configuration change immediately.
+        """
+        if self.save_timer.isActive():
+            self.save_timer.stop()
+            self.save_config()
+
     def get_working_directory(self):
         """
         Retrieves the current working directory from the configuration.
@@ -305,12 +932,12 @@ class ConfigManager:
 
     def set_working_directory(self, directory):
         """
-        Sets and saves the working directory in the configuration.
+        Sets the working directory in the configuration and schedules a save.
 
         @param directory: The directory path to set as the working directory.
         """
         self.config["working_directory"] = directory
-        self.save_config()
+        self.schedule_save()
 
     def get_duplicates_table_columns(self):
         """
@@ -322,12 +949,12 @@ class ConfigManager:
 
     def set_duplicates_table_columns(self, columns):
         """
-        Sets and saves the visibility settings for duplicates table columns.
+        Sets the visibility settings for duplicates table columns and schedules a save.
 
         @param columns: A dictionary mapping column names to their visibility (True/False).
         """
         self.config["duplicates_table_columns"] = columns
-        self.save_config()
+        self.schedule_save()
 
 class DeviceMonitor:
     """
@@ -344,6 +971,7 @@ class DeviceMonitor:
         @param table_widget: QTableWidget to display device information.
         """
         self.table_widget = table_widget
+        self._rows = []  # Row values currently shown in the table
         self.timer = QTimer()
         self.timer.timeout.connect(self.update_table)
 
@@ -368,37 +996,77 @@ class DeviceMonitor:
 
         Populates the table with device details such as device path, mount options,
         filesystem type, and total size. Displays 'N/A' for inaccessible devices.
+        Each partition's usage is queried once, and only rows whose values changed
+        are rewritten, reusing their existing table items.
         """
-        partitions = psutil.disk_partitions()
-        self.table_widget.setRowCount(len(partitions))
-        for i, partition in enumerate(partitions):
-            if self.get_access(partition.device):
-                try:
-                    usage = psutil.disk_usage(partition.mountpoint)
-                    size = bytes2human(usage.total)
-                except Exception:
-                    size = "N/A"
-                self.table_widget.setItem(i, 0, QTableWidgetItem(partition.device))
-                self.table_widget.setItem(i, 1, QTableWidgetItem(partition.opts))
-                self.table_widget.setItem(i, 2, QTableWidgetItem(partition.fstype))
-                self.table_widget.setItem(i, 3, QTableWidgetItem(size))
+        rows = []
+        for partition in PartitionCache.partitions():
+            try:
+                usage = psutil.disk_usage(partition.mountpoint)
+            except Exception:
+                usage = None
+            if usage and usage.total > 0:
+                # Mount options and filesystem types repeat across partitions and refreshes
+                rows.append((partition.device, sys.intern(partition.opts), sys.intern(partition.fstype),
+                             bytes2human(usage.total)))
             else:
-                self.table_widget.setItem(i, 0, QTableWidgetItem(partition.device))
-                self.table_widget.setItem(i, 1, QTableWidgetItem("N/A"))
-                self.table_widget.setItem(i, 2, QTableWidgetItem("N/A"))
-                self.table_widget.setItem(i, 3, QTableWidgetItem("N/A"))
+                rows.append((partition.device, "N/A", "N/A", "N/A"))
+
+        if rows == self._rows:
+            return
+
+        # Suspend repaints, sorting and item signals while filling, then refresh once
+        table = self.table_widget
+        sorting_enabled = table.isSortingEnabled()
+        table.setUpdatesEnabled(False)
+        table.setSortingEnabled(False)
+        table.blockSignals(True)
+        try:
+            table.setRowCount(len(rows))
+            for i, row in enumerate(rows):
+                if i < len(self._rows) and self._rows[i] == row:
+                    continue
+                for col, value in enumerate(row):
+                    # Reuse the existing item; a new one is only created for added rows
+                    item = table.item(i, col)
+                    if item is None:
+                        table.setItem(i, col, QTableWidgetItem(value))
+                    else:
+                        item.setText(value)
+        finally:
+            table.blockSignals(False)
+            table.setSortingEnabled(sorting_enabled)
+            table.setUpdatesEnabled(True)
+        self._rows = rows
+
+class ScanWorker(QThread):
+    """
+    A thread for collecting device information in the background.
+
+    Runs DeviceInfoCollector.collect_device_info, which walks the filesystem and may run
+    Siegfried, off the GUI thread and emits the result when done.
+    """
+    finished = pyqtSignal(dict)
 
-    def get_access(self, device):
+    def __init__(self, device, use_siegfried=True, directory=None):
         """
-        Checks if a device is accessible by attempting to retrieve its disk usage.
+        Initializes the thread with the scan parameters.
 
-        @param device: The device path to check.
-        @return: Boolean indicating whether the device is accessible.
+        @param device: The device path to analyze.
+        @param use_siegfried: Boolean indicating whether to use Siegfried for file format identification.
+        @param directory: Optional directory path to scan instead of the device's mountpoint.
         """
-        try:
-            return psutil.disk_usage(device).total > 0
-        except (PermissionError, FileNotFoundError, OSError):
-            return False
+        super().__init__()
+        self.device = device
+        self.use_siegfried = use_siegfried
+        self.directory = directory
+
+    def run(self):
+        """
+        Collects the device information and emits it, or an empty dictionary if the device is not found.
+        """
+        info = DeviceInfoCollector.collect_device_info(self.device, self.use_siegfried, self.directory)
+        self.finished.emit(info or {})
 
 class DeviceViewer:
     """
@@ -419,20 +1087,46 @@ class DeviceViewer:
         self.output_widget = output_widget
         self.figure = figure
         self.canvas = canvas
+        self.scan_worker = None
+        self.scan_workers = []  # Keeps running workers alive until they finish
+        self.ax = None  # Chart axes, created on first use and reused afterwards
+        self.bars = None  # Bars currently drawn on the chart axes
 
     def view_device(self, device, use_siegfried=True, directory=None):
         """
         Displays detailed information and a visualization for a specified device.
 
-        Collects device information using DeviceInfoCollector and displays it in the
-        output widget. Generates a bar chart of the top 10 file formats (Siegfried) or
-        extensions (lightweight scan).
+        Collects device information in a ScanWorker thread so the interface stays responsive,
+        then renders it once the scan finishes. Only the most recently requested scan is shown.
 
         @param device: The device path to analyze.
         @param use_siegfried: Boolean indicating whether to use Siegfried for file format identification.
         @param directory: Optional directory path to scan instead of the device's mountpoint.
         """
-        info = DeviceInfoCollector.collect_device_info(device, use_siegfried, directory)
+        self.output_widget.setText(f"Scanning {directory or device}...")
+        self.scan_workers = [worker for worker in self.scan_workers if worker.isRunning()]
+
+        worker = ScanWorker(device, use_siegfried, directory)
+        worker.finished.connect(lambda info: self.render(worker, info))
+        self.scan_worker = worker
+        self.scan_workers.append(worker)
+        worker.start()
+
+    def render(self, worker, info):
+        """
+        Displays the information collected by a scan worker.
+
+        Shows the device details in the output widget and generates a bar chart of the top 10
+        file formats (Siegfried) or extensions (lightweight scan). Results from a superseded
+        scan are ignored.
+
+        @param worker: The ScanWorker that collected the information.
+        @param info: The device information dictionary, empty if the device was not found.
+        """
+        if worker is not self.scan_worker:
+            return
+        device = worker.device
+        use_siegfried = worker.use_siegfried
         if not info:
             self.output_widget.setText(f"Device {device} not found.")
             return
@@ -493,39 +1187,17 @@ class DeviceViewer:
                 output.append(f"  Files Scanned: {scanned_files}\n")
                 output.append(f"{'Count':<6} | {'Format (PUID)'}")
                 output.append(f"{'-'*6} | {'-'*30}")
-                for fmt, cnt in sorted(formats.items(), key=lambda x: x[1], reverse=True):
+                # Sort once; the chart reuses the first ten entries
+                ranked_formats = sorted(formats.items(), key=operator.itemgetter(1), reverse=True)
+                for fmt, cnt in ranked_formats:
                     output.append(f"{cnt:<6} | {fmt}")
                 
                 # Generate chart
-                self.figure.clear()
-                ax = self.figure.add_subplot(111)
-                top_formats = sorted(formats.items(), key=lambda x: x[1], reverse=True)[:10]
-                if top_formats:
-                    labels = [f[0] for f in top_formats]
-                    counts = [f[1] for f in top_formats]
-                    ax.bar(labels, counts)
-                    ax.set_xlabel('File Formats (PUID)')
-                    ax.set_ylabel('Frequency')
-                    ax.set_title('Top File Formats Frequency')
-                    plt.setp(ax.get_xticklabels(), rotation=45, ha="right")
-                    self.figure.tight_layout()
-                else:
-                    # Display a message when no formats are found
-                    ax.text(0.5, 0.5, 'No file formats detected', 
-                           horizontalalignment='center', verticalalignment='center',
-                           transform=ax.transAxes, fontsize=14)
-                    ax.set_axis_off()
-                self.canvas.draw()
+                self.draw_chart(ranked_formats[:10], 'File Formats (PUID)', 'Top File Formats Frequency',
+                                'No file formats detected')
             else:
                 output.append("\nFile Formats Breakdown (PRONOM): Not available")
-                # Clear the chart and display a message
-                self.figure.clear()
-                ax = self.figure.add_subplot(111)
-                ax.text(0.5, 0.5, 'No file formats data available', 
-                       horizontalalignment='center', verticalalignment='center',
-                       transform=ax.transAxes, fontsize=14)
-                ax.set_axis_off()
-                self.canvas.draw()
+                self.draw_chart([], None, None, 'No file formats data available')
         else:
             # Lightweight file type scanning results
             if "Lightweight Scan Error" in info:
@@ -538,42 +1210,66 @@ class DeviceViewer:
                 output.append(f"{'Count':<6} | {'Extension'}")
                 output.append(f"{'-'*6} | {'-'*15}")
                 
-                for ext, cnt in sorted(file_types.items(), key=lambda x: x[1], reverse=True):
+                # Sort once; the chart reuses the first ten entries
+                ranked_extensions = sorted(file_types.items(), key=operator.itemgetter(1), reverse=True)
+                for ext, cnt in ranked_extensions:
                     output.append(f"{cnt:<6} | {ext}")
                 
                 # Generate chart for lightweight scan
-                self.figure.clear()
-                ax = self.figure.add_subplot(111)
-                top_extensions = sorted(file_types.items(), key=lambda x: x[1], reverse=True)[:10]
-                if top_extensions:
-                    labels = [f[0] for f in top_extensions]
-                    counts = [f[1] for f in top_extensions]
-                    ax.bar(labels, counts)
-                    ax.set_xlabel('File Extensions')
-                    ax.set_ylabel('Frequency')
-                    ax.set_title('Top File Extensions Frequency')
-                    plt.setp(ax.get_xticklabels(), rotation=45, ha="right")
-                    self.figure.tight_layout()
-                else:
-                    # Display a message when no extensions are found
-                    ax.text(0.5, 0.5, 'No file extensions detected', 
-                           horizontalalignment='center', verticalalignment='center',
-                           transform=ax.transAxes, fontsize=14)
-                    ax.set_axis_off()
-                self.canvas.draw()
+                self.draw_chart(ranked_extensions[:10], 'File Extensions', 'Top File Extensions Frequency',
+                                'No file extensions detected')
             else:
                 output.append("\nFile Types Breakdown (Lightweight): Not available")
-                # Clear the chart and display a message
-                self.figure.clear()
-                ax = self.figure.add_subplot(111)
-                ax.text(0.5, 0.5, 'No file types data available', 
-                       horizontalalignment='center', verticalalignment='center',
-                       transform=ax.transAxes, fontsize=14)
-                ax.set_axis_off()
-                self.canvas.draw()
+                self.draw_chart([], None, None, 'No file types data available')
 
         self.output_widget.setText("\n".join(output))
 
+    def draw_chart(self, items, xlabel, title, empty_message):
+        """
+        Draws a bar chart of counts, or a message when there is nothing to plot.
+
+        The axes are kept between calls. When the new chart has as many bars as the current
+        one, the existing bars are resized and relabelled instead of being rebuilt, and the
+        canvas is redrawn on the next event loop iteration.
+
+        @param items: List of (label, count) tuples to plot, largest first.
+        @param xlabel: Label for the x axis.
+        @param title: Title of the chart.
+        @param empty_message: Message to display when items is empty.
+        """
+        if self.ax is None:
+            self.ax = self.figure.add_subplot(111)
+        ax = self.ax
+
+        if items:
+            labels = [item[0] for item in items]
+            counts = [item[1] for item in items]
+            positions = range(len(items))
+            if self.bars is not None and len(self.bars) == len(counts):
+                for bar, count in zip(self.bars, counts):
+                    bar.set_height(count)
+                ax.relim()
+                ax.autoscale_view()
+            else:
+                ax.cla()
+                self.bars = ax.bar(positions, counts)
+            ax.set_xticks(positions)
+            ax.set_xticklabels(labels)
+            ax.set_xlabel(xlabel)
+            ax.set_ylabel('Frequency')
+            ax.set_title(title)
+            ax.set_axis_on()
+            plt.setp(ax.get_xticklabels(), rotation=45, ha="right")
+            self.figure.tight_layout()
+        else:
+            ax.cla()
+            self.bars = None
+            ax.text(0.5, 0.5, empty_message,
+                    horizontalalignment='center', verticalalignment='center',
+                    transform=ax.transAxes, fontsize=14)
+            ax.set_axis_off()
+        self.canvas.draw_idle()
+
 class ElementSelectionDialog(QDialog):
     """
     A dialog for selecting device information elements to export.
@@ -618,40 +1314,54 @@ class Exporter:
     """
     Handles exporting device information to a spreadsheet.
 
-    Uses spaCy to match device information keys to spreadsheet columns and supports
-    exporting to CSV or Excel files.
+    Matches device information keys to spreadsheet columns by name with RapidFuzz, falling
+    back to spaCy word vectors for keys without a close match, and supports exporting to
+    CSV, Excel, Parquet or Feather files.
     """
 
     def __init__(self, config_manager):
         """
-        Initializes the Exporter with a configuration manager and loads the spaCy model.
+        Initializes the Exporter with a configuration manager.
+
+        The spaCy model is loaded on the first export rather than at startup, so users who
+        never export do not pay for its import time and memory.
 
         @param config_manager: ConfigManager instance for accessing the working directory.
         """
         self.config_manager = config_manager
-        try:
-            self.nlp = spacy.load("en_core_web_lg")
-        except OSError:
-            # Show a message if the spaCy model is not available
-            QMessageBox.warning(None, "spaCy Model Missing", 
-                               "The spaCy model 'en_core_web_lg' is not installed. "
-                               "Please install it with: python -m spacy download en_core_web_lg")
-            self.nlp = None
+        self.nlp = None
+        self.vector_cache = {}  # L2-normalized spaCy vectors by text, kept across exports
+
+    def load_nlp(self):
+        """
+        Loads the spaCy model on first use.
+
+        Shows a warning if spaCy or the model is not installed.
+
+        @return: Boolean indicating whether the model is available.
+        """
+        if self.nlp is None:
+            try:
+                import spacy
+                self.nlp = spacy.load(SPACY_MODEL, exclude=SPACY_EXCLUDED_PIPES)
+            except (ImportError, OSError):
+                # Show a message if the spaCy model is not available
+                QMessageBox.warning(None, "spaCy Model Missing", 
+                                   f"The spaCy model '{SPACY_MODEL}' is not installed. "
+                                   f"Please install it with: python -m spacy download {SPACY_MODEL}")
+                return False
+        return True
 
     def export_device(self, device, parent_widget):
         """
         Exports selected device information to a spreadsheet file.
 
-        Prompts the user to select elements to export and a file location, then uses spaCy
-        to match keys to existing spreadsheet columns or creates new ones.
+        Prompts the user to select elements to export and a file location, then matches keys
+        to existing spreadsheet columns or creates new ones.
 
         @param device: The device path to export information for.
         @param parent_widget: The parent widget for displaying dialogs and status messages.
         """
-        if not self.nlp:
-            parent_widget.statusBar().showMessage("spaCy model not available. Cannot export.", 5000)
-            return
-            
         info = DeviceInfoCollector.collect_device_info(device)
         if not info:
             parent_widget.statusBar().showMessage(f"Device {device} not found.", 5000)
@@ -674,37 +1384,69 @@ class Exporter:
                 return
             self.config_manager.set_working_directory(working_directory)
 
-        file_path = QFileDialog.getSaveFileName(parent_widget, "Save Spreadsheet", working_directory, "CSV (*.csv);;Excel (*.xlsx)")[0]
+        file_path = QFileDialog.getSaveFileName(parent_widget, "Save Spreadsheet", working_directory, "CSV (*.csv);;Excel (*.xlsx);;Parquet (*.parquet);;Feather (*.feather)")[0]
         if not file_path:
             return
 
         try:
-            # Read existing spreadsheet or create a new one
-            if os.path.exists(file_path):
-                if file_path.endswith('.csv'):
-                    df = pd.read_csv(file_path)
+            is_csv = file_path.endswith('.csv')
+            is_columnar = file_path.endswith(('.parquet', '.feather'))
+
+            # Read only the header of an existing spreadsheet; its data rows are never loaded
+            workbook = None
+            column_names = []
+            if os.path.exists(file_path) and os.path.getsize(file_path) > 0:
+                # Readers are imported here so startup and new-file exports do not pay for them
+                if is_csv:
+                    import pandas as pd
+                    column_names = list(pd.read_csv(file_path, nrows=0).columns)
+                elif is_columnar:
+                    column_names = self.columnar_header(file_path)
                 else:
-                    df = pd.read_excel(file_path)
-            else:
-                df = pd.DataFrame()
-            column_names = list(df.columns) if not df.empty else []
-
-            # Match selected keys to spreadsheet columns using spaCy
+                    import openpyxl
+                    workbook = openpyxl.load_workbook(file_path)
+                    header = list(next(workbook.active.iter_rows(max_row=1, values_only=True), ()))
+                    while header and header[-1] is None:
+                        header.pop()
+                    column_names = ["" if name is None else str(name) for name in header]
+            existing_columns = list(column_names)
+
+            # Match selected keys to spreadsheet columns by name first. spaCy is only loaded
+            # when some key has no close lexical match.
             export_data = {}
             matched_scores = {}
-            col_docs = {col: self.nlp(col) for col in column_names}
+            lexical_matches = {}
+            if existing_columns:
+                lexical_matches = {key: self.lexical_match(key, existing_columns) for key in selected_keys}
+            semantic_keys = [key for key, (_, score) in lexical_matches.items() if score < FUZZY_MATCH_THRESHOLD]
+
+            # The vectors are L2-normalized, so a single matrix product scores every remaining
+            # key against every column (cosine similarity, as Doc.similarity computes it).
+            similarities = None
+            if semantic_keys and self.load_nlp():
+                vectors = self.text_vectors(existing_columns + semantic_keys)
+                similarities = vectors[len(existing_columns):] @ vectors[:len(existing_columns)].T
+                # Like Doc.similarity, identical text is a perfect match even without vectors
+                col_indices = {col: i for i, col in enumerate(existing_columns)}
+                for row, key in enumerate(semantic_keys):
+                    if key in col_indices:
+                        similarities[row, col_indices[key]] = 1.0
+                key_rows = {key: row for row, key in enumerate(semantic_keys)}
 
             for key in selected_keys:
                 value   = info[key]
-                key_doc = self.nlp(key)
-                best_match = None
-                best_score = 0
-
-                for col, col_doc in col_docs.items():
-                    score = key_doc.similarity(col_doc)
-                    if score > best_score:
-                        best_score  = score
-                        best_match  = col
+                best_match, best_score = lexical_matches.get(key, (None, 0))
+
+                # Keys without a close lexical match are scored with word vectors instead
+                if best_score < FUZZY_MATCH_THRESHOLD:
+                    best_match = None
+                    best_score = 0
+                    if similarities is not None:
+                        scores = similarities[key_rows[key]]
+                        best_index = int(scores.argmax())
+                        if scores[best_index] > best_score:
+                            best_score  = float(scores[best_index])
+                            best_match  = existing_columns[best_index]
 
                 # If it's a good match, map to that column; otherwise add a new one
                 if best_match and best_score >= matched_scores.get(best_match, 0):
@@ -717,96 +1459,668 @@ class Exporter:
 
             # Build new row with all spreadsheet columns
             new_row = {col: export_data.get(col, None) for col in column_names}
-            df = pd.concat([df, pd.DataFrame([new_row])], ignore_index=True)
 
-            # Save to file
-            if file_path.endswith('.csv'):
-                df.to_csv(file_path, index=False)
+            # Append the row to the file
+            if is_csv:
+                self.append_csv_row(file_path, existing_columns, column_names, new_row)
+            elif is_columnar:
+                self.append_columnar_row(file_path, existing_columns, column_names, new_row)
             else:
-                df.to_excel(file_path, index=False)
+                self.append_excel_row(file_path, workbook, existing_columns, column_names, new_row)
             parent_widget.statusBar().showMessage(f"Exported to {file_path}", 5000)
         except Exception as e:
             parent_widget.statusBar().showMessage(f"Error exporting: {e}", 5000)
 
+    def text_vectors(self, texts):
+        """
+        Returns L2-normalized spaCy word vectors for a list of strings.
+
+        Vectors are cached by text, so column names and keys seen in an earlier export are
+        not processed again; the remaining strings go through spaCy in one batch.
+
+        @param texts: List of strings to vectorize.
+        @return: A NumPy array with one normalized vector per string.
+        """
+        import numpy as np
+        missing = [text for text in dict.fromkeys(texts) if text not in self.vector_cache]
+        for text, doc in zip(missing, self.nlp.pipe(missing)):
+            vector = doc.vector
+            self.vector_cache[text] = vector / (np.linalg.norm(vector) + 1e-9)
+        return np.array([self.vector_cache[text] for text in texts])
+
+    @staticmethod
+    def lexical_match(key, columns):
+        """
+        Finds the column whose name is closest to a key with RapidFuzz's token sort ratio.
+
+        Case, punctuation and word order are ignored, so "Total Size" matches "total_size".
+        Unlike the weighted ratio, it does not score partial matches, which would give a key
+        that merely contains a column name ("Scanned Files" and "Files") a score of 90.
+
+        @param key: The device information key.
+        @param columns: The existing spreadsheet column names.
+        @return: A tuple of (best column name or None, score between 0 and 1).
+        """
+        if fuzz is None:
+            return (key, 1.0) if key in columns else (None, 0.0)
+        result = fuzzy_process.extractOne(key, columns, scorer=fuzz.token_sort_ratio, processor=fuzzy_utils.default_process)
+        if result is None:
+            return None, 0.0
+        return result[0], result[1] / 100.0
+
+    @staticmethod
+    def append_csv_row(file_path, existing_columns, column_names, new_row):
+        """
+        Appends a row to a CSV file without reading its existing rows.
+
+        The row is written in append mode when the header is unchanged. The file is only
+        rewritten when the export adds new columns, since the header line must change.
+
+        @param file_path: Path of the CSV file.
+        @param existing_columns: Column names already in the file (empty for a new file).
+        @param column_names: Column names after matching, including any new columns.
+        @param new_row: Dictionary mapping each column name to its value.
+        """
+        if not existing_columns:
+            with open(file_path, "w", newline="", encoding="utf-8") as f:
+                writer = csv.writer(f)
+                writer.writerow(column_names)
+                writer.writerow([new_row[col] for col in column_names])
+        elif column_names == existing_columns:
+            # A file that does not end in a newline would get the row glued to its last line
+            with open(file_path, "rb") as f:
+                f.seek(0, os.SEEK_END)
+                missing_newline = f.tell() > 0 and f.seek(-1, os.SEEK_END) >= 0 and f.read(1) not in b"\r\n"
+            with open(file_path, "a", newline="", encoding="utf-8") as f:
+                writer = csv.writer(f)
+                if missing_newline:
+                    f.write(writer.dialect.lineterminator)
+                writer.writerow([new_row[col] for col in column_names])
+        else:
+            import pandas as pd
+            # Read as text without NA detection so existing values such as 'N/A' are written
+            # back unchanged, then add the new columns as empty text and set the row in place
+            # instead of concatenating a second frame. The row is converted to text the way
+            # csv.writer does it, so pandas cannot turn its integers into floats.
+            df = pd.read_csv(file_path, dtype=object, keep_default_na=False, na_filter=False)
+            df = df.reindex(columns=column_names, fill_value='').astype(object)
+            df.loc[len(df)] = ["" if new_row[col] is None else str(new_row[col]) for col in column_names]
+            # Write through a 1 MiB buffer and let pandas format the rows in batches
+            with open(file_path, "w", newline="", encoding="utf-8", buffering=1 << 20) as f:
+                df.to_csv(f, index=False, chunksize=50_000)
+
+    @staticmethod
+    def append_excel_row(file_path, workbook, existing_columns, column_names, new_row):
+        """
+        Appends a row to the active sheet of an Excel workbook with openpyxl.
+
+        New columns only add cells to the header row, so existing data rows are left as is.
+        A new file is written with a write-only workbook, which streams rows to disk without
+        building a cell tree.
+
+        @param file_path: Path of the Excel file.
+        @param workbook: The loaded openpyxl workbook, or None to create a new one.
+        @param existing_columns: Column names already in the sheet (empty for a new file).
+        @param column_names: Column names after matching, including any new columns.
+        @param new_row: Dictionary mapping each column name to its value.
+        """
+        if workbook is None:
+            import openpyxl
+            workbook = openpyxl.Workbook(write_only=True)
+            sheet = workbook.create_sheet()
+            sheet.append(column_names)
+            sheet.append([Exporter.excel_value(new_row[col]) for col in column_names])
+            workbook.save(file_path)
+            return
+        sheet = workbook.active
+        for index in range(len(existing_columns), len(column_names)):
+            sheet.cell(row=1, column=index + 1, value=column_names[index])
+        sheet.append([Exporter.excel_value(new_row[col]) for col in column_names])
+        workbook.save(file_path)
+
+    @staticmethod
+    def columnar_header(file_path):
+        """
+        Reads the column names of a Parquet or Feather file from its schema alone.
+
+        @param file_path: Path of the .parquet or .feather file.
+        @return: List of column names.
+        """
+        if file_path.endswith('.parquet'):
+            import pyarrow.parquet
+            return list(pyarrow.parquet.read_schema(file_path).names)
+        import pyarrow.ipc
+        with pyarrow.ipc.open_file(file_path) as reader:
+            return list(reader.schema.names)
+
+    @staticmethod
+    def append_columnar_row(file_path, existing_columns, column_names, new_row):
+        """
+        Appends a row to a Parquet or Feather file, compressed with Zstandard.
+
+        Columnar files cannot be appended to in place, so the existing rows are read back
+        and the file is rewritten through a temporary file. Values are stored as text so
+        every column keeps a single type across exports.
+
+        @param file_path: Path of the .parquet or .feather file.
+        @param existing_columns: Column names already in the file (empty for a new file).
+        @param column_names: Column names after matching, including any new columns.
+        @param new_row: Dictionary mapping each column name to its value.
+        """
+        import pandas as pd
+        is_parquet = file_path.endswith('.parquet')
+        df = pd.DataFrame([{col: None if new_row[col] is None else str(new_row[col]) for col in column_names}],
+                          columns=column_names)
+        if existing_columns:
+            existing = pd.read_parquet(file_path) if is_parquet else pd.read_feather(file_path)
+            df = pd.concat([existing, df], ignore_index=True)
+        temp_path = file_path + ".tmp"
+        if is_parquet:
+            df.to_parquet(temp_path, compression="zstd", index=False)
+        else:
+            df.to_feather(temp_path, compression="zstd")
+        os.replace(temp_path, file_path)
+
+    @staticmethod
+    def excel_value(value):
+        """
+        Converts a device information value to a type openpyxl can store in a cell.
+
+        Nested values such as the filesystem statistics dictionary are stored as text,
+        matching what pandas writes.
+
+        @param value: The value to convert.
+        @return: The value unchanged if it is a plain scalar, otherwise its string form.
+        """
+        if value is None or isinstance(value, (str, int, float, bool)):
+            return value
+        return str(value)
+
+def _hash_file(file_path, limit=None):
+    """
+    Computes the content hash of a file.
+
+    Uses BLAKE3 (SIMD-accelerated) when the blake3 package is available and SHA-256
+    otherwise, which OpenSSL computes with the CPU's SHA extensions where present. The hash
+    is only compared for equality, so cryptographic strength is not required. Small files
+    are read in one call; larger ones are read in 1 MiB chunks into a reused buffer with a
+    sequential read-ahead hint, and for files up to 256 MiB reads for the whole file are
+    queued up front. Files are never memory-mapped: a read error on a mapping (a damaged
+    floppy or CD, or a file truncated during the scan) raises SIGBUS and kills the process,
+    whereas read() reports it as an OSError and the file is skipped.
+
+    Defined at module level so it can be pickled and run in a worker process.
+
+    @param file_path: The path to the file to hash.
+    @param limit: Optional number of leading bytes to hash instead of the whole file.
+    @return: A tuple containing the raw digest bytes and file path, or (None, file_path) if an error occurs.
+    """
+    try:
+        with open(file_path, 'rb') as f:
+            file_hash = blake3.blake3() if blake3 else hashlib.sha256()
+            size = os.fstat(f.fileno()).st_size
+            if limit is not None:
+                file_hash.update(f.read(limit))
+            elif size < SINGLE_READ_MAX_SIZE:
+                file_hash.update(f.read())
+            else:
+                if hasattr(os, "posix_fadvise"):
+                    os.posix_fadvise(f.fileno(), 0, 0, os.POSIX_FADV_SEQUENTIAL)
+                    # Queue reads for the whole file at once, so the device works through them
+                    # while the hash runs
+                    if size <= READ_AHEAD_MAX_SIZE:
+                        os.posix_fadvise(f.fileno(), 0, 0, os.POSIX_FADV_WILLNEED)
+                # Read into one reused buffer instead of allocating a bytes object per chunk
+                buffer = bytearray(HASH_CHUNK_SIZE)
+                view = memoryview(buffer)
+                while n := f.readinto(buffer):
+                    file_hash.update(view[:n])
+            return file_hash.digest(), file_path
+    except Exception:
+        return None, file_path
+
+class HashCache:
+    """
+    Persistent cache of full file hashes, kept in a SQLite database.
+
+    An entry is found by filesystem identity and the file's path relative to its mountpoint,
+    and is only used while the inode number, size and modification time all still match,
+    so re-scanning unchanged files (for example a disk that is mounted again later) reads
+    nothing. The filesystem identity combines the volume UUID with statvfs' f_fsid, since a
+    device name such as /dev/sdb1 is reused by every disk plugged into that slot.
+    Filesystems that hand out inode numbers afresh on each mount (FAT and exFAT) are never
+    cached, nor are filesystems missing from the partition list. The hash algorithm is
+    stored with each entry, so BLAKE3 and SHA-256 digests are never compared with each
+    other. Any database error disables the cache for the scan instead of failing it.
+    """
+
+    ALGORITHM = "blake3" if blake3 else "sha256"
+    UUID_DIRECTORY = "/dev/disk/by-uuid"
+    # Filesystems without inode numbers that stay the same across mounts
+    UNSTABLE_INODE_FILESYSTEMS = frozenset({"vfat", "msdos", "fat", "umsdos", "exfat", "fuseblk"})
+
+    def __init__(self, path):
+        """
+        Opens the cache database, creating it if needed.
+
+        @param path: Path of the SQLite database file.
+        """
+        self.volumes = {}  # st_dev -> (volume identity, mountpoint), or None if not cacheable
+        try:
+            self.connection = sqlite3.connect(path)
+            # Write-ahead logging lets concurrent scans read while another one writes
+            self.connection.execute("PRAGMA journal_mode=WAL")
+            self.connection.execute(
+                "CREATE TABLE IF NOT EXISTS file_hashes (algorithm TEXT, volume TEXT, path TEXT, "
+                "inode INTEGER, size INTEGER, mtime_ns INTEGER, digest BLOB, "
+                "PRIMARY KEY (algorithm, volume, path))")
+        except sqlite3.Error:
+            self.connection = None
+
+    def volume(self, device, path):
+        """
+        Identifies the filesystem holding a file, once per device number.
+
+        @param device: The st_dev of the file.
+        @param path: Path of a file on that device, used to find its mountpoint.
+        @return: A tuple of (volume identity, mountpoint), or None if the filesystem's
+                 entries cannot be trusted across mounts.
+        """
+        if device in self.volumes:
+            return self.volumes[device]
+        volume = None
+        try:
+            mountpoint = os.path.dirname(os.path.abspath(path))
+            while not os.path.ismount(mountpoint):
+                mountpoint = os.path.dirname(mountpoint)
+            partition = next((p for p in PartitionCache.partitions() if p.mountpoint == mountpoint), None)
+            if partition is not None and partition.fstype.lower() not in self.UNSTABLE_INODE_FILESYSTEMS:
+                uuid = ""
+                if os.path.isdir(self.UUID_DIRECTORY):
+                    real_device = os.path.realpath(partition.device)
+                    with os.scandir(self.UUID_DIRECTORY) as entries:
+                        uuid = next((entry.name for entry in entries
+                                     if os.path.realpath(entry.path) == real_device), "")
+                volume = (f"{uuid}/{os.statvfs(mountpoint).f_fsid:x}", mountpoint)
+        except OSError:
+            volume = None
+        self.volumes[device] = volume
+        return volume
+
+    def entry_key(self, path, stat_key):
+        """
+        Builds the cache key of a file.
+
+        @param path: The file path.
+        @param stat_key: The file's (device, inode, size, mtime_ns) tuple.
+        @return: A tuple of (volume identity, relative path, inode, size, mtime_ns), or None
+                 if the file's filesystem is not cached.
+        """
+        volume = self.volume(stat_key[0], path)
+        if volume is None:
+            return None
+        return (volume[0], os.path.relpath(path, volume[1])) + stat_key[1:]
+
+    def lookup(self, keys):
+        """
+        Finds cached hashes for files that have not changed since they were hashed.
+
+        The entries of all volumes involved are read in one query and matched in memory.
+
+        @param keys: Dictionary mapping file paths to (device, inode, size, mtime_ns) tuples.
+        @return: Dictionary mapping the paths of unchanged files to their digests.
+        """
+        if self.connection is None or not keys:
+            return {}
+        entry_keys = {path: self.entry_key(path, stat_key) for path, stat_key in keys.items()}
+        volumes = list({key[0] for key in entry_keys.values() if key is not None})
+        if not volumes:
+            return {}
+        try:
+            rows = self.connection.execute(
+                f"SELECT volume, path, inode, size, mtime_ns, digest FROM file_hashes "
+                f"WHERE algorithm = ? AND volume IN ({', '.join('?' * len(volumes))})",
+                [self.ALGORITHM] + volumes)
+            stored = {tuple(row[:5]): row[5] for row in rows}
+        except sqlite3.Error:
+            return {}
+        found = {}
+        for path, key in entry_keys.items():
+            digest = stored.get(key) if key is not None else None
+            if digest is not None:
+                found[path] = digest
+        return found
+
+    def store(self, entries):
+        """
+        Saves hashes in a single transaction, replacing older entries for the same files.
+
+        @param entries: Iterable of (path, (device, inode, size, mtime_ns), digest) tuples.
+        """
+        if self.connection is None:
+            return
+        rows = []
+        for path, stat_key, digest in entries:
+            key = self.entry_key(path, stat_key)
+            if key is not None:
+                rows.append((self.ALGORITHM,) + key + (digest,))
+        try:
+            with self.connection:
+                self.connection.executemany("INSERT OR REPLACE INTO file_hashes VALUES (?, ?, ?, ?, ?, ?, ?)", rows)
+        except sqlite3.Error:
+            pass
+
+    def close(self):
+        """
+        Closes the database connection.
+        """
+        if self.connection is not None:
+            self.connection.close()
+            self.connection = None
+
 class DuplicateFinderThread(QThread):
     """
-    A thread for finding duplicate files in a directory using MD5 hashing.
+    A thread for finding duplicate files in a directory using content hashing.
 
     Runs in the background to compute file hashes and identify duplicates, emitting
-    progress and result signals.
+    progress and result signals. If the scan fails, an error signal is emitted before
+    finished, which is always emitted.
     """
     progress = pyqtSignal(int)
     finished = pyqtSignal(dict)
+    error = pyqtSignal(str)
 
-    def __init__(self, directory):
+    def __init__(self, directory, cache_file=HASH_CACHE_FILE):
         """
         Initializes the thread with a directory to scan for duplicates.
 
         @param directory: The directory path to scan for duplicate files.
+        @param cache_file: Path of the SQLite database caching full file hashes between scans.
         """
         super().__init__()
         self.directory = directory
-        self._result_all_hashes = {}  # Store all file hashes
+        self.cache_file = cache_file
 
-    def md5(self, file_path):
+    @staticmethod
+    def is_rotational(path):
         """
-        Computes the MD5 hash of a file.
+        Checks whether a path lives on a rotational (spinning) disk.
 
-        Reads the file in chunks to handle large files efficiently.
+        Resolves the block device backing the path through /sys/dev/block and reads its
+        queue/rotational flag. For a partition the flag lives on the parent disk.
+        Only available on Linux; other systems are reported as non-rotational.
 
-        @param file_path: The path to the file to hash.
-        @return: A tuple containing the MD5 hash (string) and file path, or (None, file_path) if an error occurs.
+        @param path: A path on the device to check.
+        @return: Boolean indicating whether the backing device is rotational.
         """
         try:
-            with open(file_path, 'rb') as f:
-                file_hash = hashlib.md5()
-                while chunk := f.read(8192):
-                    file_hash.update(chunk)
-                return file_hash.hexdigest(), file_path
-        except Exception:
-            return None, file_path
+            st_dev = os.stat(path).st_dev
+            sys_dir = os.path.realpath(f"/sys/dev/block/{os.major(st_dev)}:{os.minor(st_dev)}")
+            for candidate in (sys_dir, os.path.dirname(sys_dir)):
+                flag_path = os.path.join(candidate, "queue", "rotational")
+                if os.path.exists(flag_path):
+                    with open(flag_path) as f:
+                        return f.read().strip() == "1"
+        except (OSError, AttributeError):
+            pass
+        return False
 
     def run(self):
         """
-        Executes the duplicate file search in the specified directory.
+        Executes the duplicate file search and emits its result.
+
+        Any failure is reported through the error signal, and finished is emitted with
+        whatever was found, so the caller can always re-enable its controls.
+        """
+        try:
+            hashes = self.scan()
+        except Exception as e:
+            self.error.emit(str(e))
+            hashes = {}
+        self.finished.emit(hashes)
 
-        Scans all files, computes their MD5 hashes in parallel, and identifies duplicates.
-        Emits progress signals during processing and a finished signal with the duplicates dictionary.
+    def scan(self):
+        """
+        Searches the specified directory for duplicate files.
+
+        Scans all files and groups them by size, since files of different sizes can never be
+        duplicates. Files sharing a size are first compared by a hash of their first 64 KiB,
+        and only files sharing that too are hashed in full, in parallel worker processes;
+        the others are recorded without a full hash. Full hashes of files unchanged since an
+        earlier scan are taken from the hash cache instead of being computed again. Emits
+        progress signals, measured in bytes hashed. If a hashing worker dies, the error
+        signal is emitted and the files hashed until then are still returned.
+
+        @return: A dictionary mapping every hash to its list of file paths; lists of more
+                 than one path are duplicates.
         """
         hashes = {}
-        duplicates = {}
-        file_paths = []
+        size_groups = defaultdict(list)
+
+        # On spinning disks, hashing in inode order keeps reads close to on-disk order and
+        # cuts seeking. On SSDs the sort is pure overhead, so it is skipped there.
+        sort_by_inode = self.is_rotational(self.directory)
+
+        # Scan all files in the directory, grouping them by size as we go
+        stack = [self.directory]
+        while stack:
+            try:
+                with os.scandir(stack.pop()) as entries:
+                    for entry in entries:
+                        try:
+                            if entry.is_dir():
+                                # Like os.walk, symlinked directories are not followed
+                                if not entry.is_symlink():
+                                    stack.append(entry.path)
+                            else:
+                                stat = entry.stat()
+                                # (device, inode, size, mtime) identifies unchanged files in the hash cache
+                                size_groups[stat.st_size].append(
+                                    (entry.inode(), entry.path,
+                                     (stat.st_dev, stat.st_ino, stat.st_size, stat.st_mtime_ns)))
+                        except OSError:
+                            continue
+            except OSError:
+                continue
+
+        if not size_groups:
+            return {}
+
+        candidates = []
+        cache_keys = {}
+        for size, files in size_groups.items():
+            if len(files) > 1:
+                candidates.extend((inode, path, size) for inode, path, _ in files)
+                cache_keys.update((path, key) for _, path, key in files)
+            else:
+                # Unique size: no duplicate is possible, so list the file without hashing it
+                hashes[f"Unique size ({size} bytes)"] = [files[0][1]]
+        del size_groups
+
+        # Take the full hashes of unchanged files from the cache. Scandir reports no device
+        # or inode numbers on Windows, so the cache is only used on POSIX systems.
+        hash_cache = HashCache(self.cache_file) if os.name == 'posix' else None
+        cached = hash_cache.lookup(cache_keys) if hash_cache else {}
+        results = [(digest, path) for path, digest in cached.items()]
+        candidates = [candidate for candidate in candidates if candidate[1] not in cached]
+        cached_sizes = {cache_keys[path][2] for path in cached}
+        if sort_by_inode:
+            candidates.sort()
+
+        # Files no larger than the prefix are hashed in full straight away; larger ones are
+        # first told apart by a hash of their first PARTIAL_HASH_SIZE bytes. A file sharing
+        # its size with a cached one is hashed in full too, as the cached file has no prefix
+        # hash to compare against.
+        small_files = [candidate for candidate in candidates
+                       if candidate[2] <= PARTIAL_HASH_SIZE or candidate[2] in cached_sizes]
+        large_files = [candidate for candidate in candidates
+                       if candidate[2] > PARTIAL_HASH_SIZE and candidate[2] not in cached_sizes]
+
+        # Progress is measured in bytes to hash. The plan assumes every large file needs a
+        # full hash and shrinks as the prefix hashes rule files out.
+        planned_bytes = (sum(size for _, _, size in small_files)
+                         + sum(PARTIAL_HASH_SIZE + size for _, _, size in large_files))
+        hashed_bytes = 0
+        # Each emit is a queued cross-thread signal, so report only when the percentage
+        # changes and no more than 50 times a second, plus once at the end
+        last_emitted_pct = -1
+        last_emit_time = 0.0
+
+        def report_progress(force=False):
+            nonlocal last_emitted_pct, last_emit_time
+            pct = min(100, int((hashed_bytes / planned_bytes) * 100)) if planned_bytes > 0 else 100
+            if force or (pct != last_emitted_pct
+                         and time.monotonic() - last_emit_time >= PROGRESS_INTERVAL):
+                self.progress.emit(pct)
+                last_emitted_pct = pct
+                last_emit_time = time.monotonic()
+
+        # Hash in worker processes so hashing is not serialized by the GIL; paths are sent
+        # in chunks to amortize the inter-process round-trips. Small scans use threads,
+        # since hashlib releases the GIL on large updates and no processes need starting.
+        # Workers are started fresh rather than forked, as forking a process running Qt
+        # threads can leave locks held in the child.
+        if len(candidates) < PROCESS_POOL_MIN_FILES:
+            executor = concurrent.futures.ThreadPoolExecutor(max_workers=os.cpu_count())
+        else:
+            start_method = "forkserver" if "forkserver" in multiprocessing.get_all_start_methods() else "spawn"
+            executor = concurrent.futures.ProcessPoolExecutor(
+                max_workers=os.cpu_count(), mp_context=multiprocessing.get_context(start_method))
+        new_hashes = []
+        try:
+            # Only files sharing both size and prefix hash can be duplicates
+            prefix_groups = defaultdict(list)
+            prefix_results = executor.map(_hash_file, [path for _, path, _ in large_files],
+                                          itertools.repeat(PARTIAL_HASH_SIZE), chunksize=64)
+            for (prefix_hash, _), candidate in zip(prefix_results, large_files):
+                hashed_bytes += PARTIAL_HASH_SIZE
+                report_progress()
+                if prefix_hash:
+                    prefix_groups[(candidate[2], prefix_hash)].append(candidate)
+                else:
+                    planned_bytes -= candidate[2]
 
-        # Scan all files in the directory
-        for root, _, files in os.walk(self.directory):
-            for file in files:
-                file_paths.append(os.path.join(root, file))
+            full_files = small_files
+            for (size, prefix_hash), files in prefix_groups.items():
+                if len(files) > 1:
+                    full_files.extend(files)
+                else:
+                    # Unique start: the file cannot have a duplicate, so its full hash is skipped
+                    hashes[f"Unique prefix ({size} bytes, {prefix_hash.hex()[:16]})"] = [files[0][1]]
+                    planned_bytes -= size
+            if sort_by_inode:
+                full_files.sort()
+
+            for result, candidate in zip(
+                    executor.map(_hash_file, [path for _, path, _ in full_files], chunksize=64), full_files):
+                hashed_bytes += candidate[2]
+                report_progress()
+                new_hashes.append(result)
+            report_progress(force=True)
+        except concurrent.futures.BrokenExecutor as e:
+            # A worker died (e.g. killed by the system); keep the hashes computed so far
+            self.error.emit(f"Hashing stopped early: {e}")
+        finally:
+            executor.shutdown()
+
+        if hash_cache:
+            hash_cache.store((file_path, cache_keys[file_path], file_hash)
+                             for file_hash, file_path in new_hashes if file_hash)
+            hash_cache.close()
+        results.extend(new_hashes)
+
+        # Bucket the full hashes in one pass once hashing is done
+        buckets = defaultdict(list)
+        for file_hash, file_path in results:
+            if file_hash:
+                buckets[file_hash].append(file_path)
+        hashes.update(buckets)
+
+        return hashes
+
+class DuplicatesTableModel(QAbstractTableModel):
+    """
+    Table model serving the duplicates view straight from a list of row tuples.
+
+    The view asks for cell text only for the rows on screen, so no per-cell item objects are
+    created however many files a scan finds. Sorting reorders the row list in place.
+    """
 
-        total_files = len(file_paths)
-        if total_files == 0:
-            self.finished.emit({})
+    HEADERS = ["File Name", "Hash", "Location"]
+
+    def __init__(self, parent=None):
+        """
+        Initializes an empty model.
+
+        @param parent: Optional parent QObject.
+        """
+        super().__init__(parent)
+        self.rows = []
+        self.sort_column = -1
+        self.sort_order = Qt.AscendingOrder
+
+    def rowCount(self, parent=QModelIndex()):
+        """
+        @param parent: The parent index; only the invalid root index has rows.
+        @return: The number of rows.
+        """
+        return 0 if parent.isValid() else len(self.rows)
+
+    def columnCount(self, parent=QModelIndex()):
+        """
+        @param parent: The parent index; only the invalid root index has columns.
+        @return: The number of columns.
+        """
+        return 0 if parent.isValid() else len(self.HEADERS)
+
+    def data(self, index, role=Qt.DisplayRole):
+        """
+        @param index: The model index of the cell.
+        @param role: The data role requested by the view.
+        @return: The cell text for the display role, otherwise None.
+        """
+        if role == Qt.DisplayRole and index.isValid():
+            return str(self.rows[index.row()][index.column()])
+        return None
+
+    def headerData(self, section, orientation, role=Qt.DisplayRole):
+        """
+        @param section: The column or row number.
+        @param orientation: Qt.Horizontal for column headers.
+        @param role: The data role requested by the view.
+        @return: The column title for horizontal display-role headers.
+        """
+        if role == Qt.DisplayRole and orientation == Qt.Horizontal:
+            return self.HEADERS[section]
+        return super().headerData(section, orientation, role)
+
+    def sort(self, column, order=Qt.AscendingOrder):
+        """
+        Sorts the rows by a column's text.
+
+        @param column: Index of the column to sort by, or -1 to keep the current order.
+        @param order: Qt.AscendingOrder or Qt.DescendingOrder.
+        """
+        self.sort_column = column
+        self.sort_order = order
+        if column < 0:
             return
-            
-        with concurrent.futures.ThreadPoolExecutor() as executor:
-            future_to_file = {executor.submit(self.md5, fp): fp for fp in file_paths}
-            processed = 0
-            for future in concurrent.futures.as_completed(future_to_file):
-                processed += 1
-                self.progress.emit(int((processed / total_files) * 100))
-                file_hash, file_path = future.result()
-                if file_hash:
-                    if file_hash in hashes:
-                        if file_hash in duplicates:
-                            duplicates[file_hash].append(file_path)
-                        else:
-                            duplicates[file_hash] = [hashes[file_hash], file_path]
-                    else:
-                        hashes[file_hash] = file_path
+        self.layoutAboutToBeChanged.emit()
+        self.rows.sort(key=lambda row: str(row[column]), reverse=(order == Qt.DescendingOrder))
+        self.layoutChanged.emit()
 
-        # Store all file hashes for later use (including unique files)
-        self._result_all_hashes = hashes
+    def set_rows(self, rows):
+        """
+        Replaces all rows, keeping the current sort order.
 
-        self.finished.emit(duplicates)
+        @param rows: List of (file name, hash, location) tuples.
+        """
+        self.beginResetModel()
+        self.rows = rows
+        if self.sort_column >= 0:
+            self.rows.sort(key=lambda row: str(row[self.sort_column]),
+                           reverse=(self.sort_order == Qt.DescendingOrder))
+        self.endResetModel()
 
 class DuplicateFinder:
     """
@@ -826,7 +2140,7 @@ class DuplicateFinder:
         @param btn_browse: QPushButton for browsing directories.
         @param btn_find: QPushButton for initiating the duplicate search.
         @param progress_bar: QProgressBar for showing scan progress.
-        @param table_widget: QTableWidget for displaying results.
+        @param table_widget: QTableView with a DuplicatesTableModel for displaying results.
         @param filter_dropdown: QComboBox for filtering between duplicates and all files.
         @param parent_widget: The parent widget (MainWindow) for accessing the status bar and config.
         """
@@ -841,6 +2155,7 @@ class DuplicateFinder:
 
         self.all_file_hashes = {}  # Store all files, not just dupes
         self.duplicates_only = {}
+        self.scan_error = None  # Error reported by the last duplicate search, if any
 
         self.btn_browse.clicked.connect(self.browse_directory)
         self.btn_find.clicked.connect(self.find_duplicates)
@@ -880,7 +2195,7 @@ class DuplicateFinder:
         Sets the selected directory in the dir_input field.
         """
         device = self.combo_box.currentText()
-        mountpoint = next((p.mountpoint for p in psutil.disk_partitions() if p.device == device), None)
+        mountpoint = PartitionCache.mountpoint(device)
         if mountpoint:
             directory = QFileDialog.getExistingDirectory(self.parent_widget, "Select Directory", mountpoint)
             if directory:
@@ -892,39 +2207,44 @@ class DuplicateFinder:
 
         Disables the find button during processing and updates the progress bar.
         """
-        directory = self.dir_input.text() or next((p.mountpoint for p in psutil.disk_partitions() if p.device == self.combo_box.currentText()), None)
+        directory = self.dir_input.text() or PartitionCache.mountpoint(self.combo_box.currentText())
         if not directory or not os.path.exists(directory):
             self.parent_widget.statusBar().showMessage("Invalid directory selected.", 5000)
             return
 
+        self.scan_error = None
         self.dupe_thread = DuplicateFinderThread(directory)
         self.dupe_thread.progress.connect(self.progress_bar.setValue)
+        self.dupe_thread.error.connect(self.record_scan_error)
         self.dupe_thread.finished.connect(self.display_duplicates)
         self.dupe_thread.start()
         self.btn_find.setEnabled(False)
 
-    def display_duplicates(self, duplicates):
+    def record_scan_error(self, message):
         """
-        Displays the results of the duplicate file search in the table widget.
+        Keeps an error reported by the duplicate search, to be shown once it finishes.
 
-        Updates the table with duplicate files or all files based on the filter setting.
+        @param message: The error message.
+        """
+        self.scan_error = message
 
-        @param duplicates: A dictionary mapping MD5 hashes to lists of duplicate file paths.
+    def display_duplicates(self, all_hashes):
         """
-        self.duplicates_only = duplicates
-        self.all_file_hashes = {}  # key: hash, value: list of files
+        Displays the results of the duplicate file search in the table widget.
 
-        for hash_val, files in duplicates.items():
-            self.all_file_hashes[hash_val] = files
+        Updates the table with duplicate files or all files based on the filter setting.
 
-        # Add in non-duplicate hashes from the scan
-        for hash_val, file_path in self.dupe_thread._result_all_hashes.items():
-            if hash_val not in self.all_file_hashes:
-                self.all_file_hashes[hash_val] = [file_path]
+        @param all_hashes: A dictionary mapping content hashes to lists of file paths.
+        """
+        self.all_file_hashes = all_hashes
+        self.duplicates_only = {hash_val: files for hash_val, files in all_hashes.items() if len(files) > 1}
 
         self.update_table_display()
         self.btn_find.setEnabled(True)
-        self.parent_widget.statusBar().showMessage("Duplicate search completed.", 5000)
+        if self.scan_error:
+            self.parent_widget.statusBar().showMessage(f"Duplicate search incomplete: {self.scan_error}", 10000)
+        else:
+            self.parent_widget.statusBar().showMessage("Duplicate search completed.", 5000)
 
     def update_table_display(self):
         """
@@ -941,41 +2261,29 @@ class DuplicateFinder:
         # Build a flat list of rows: one row per file
         rows = []
         for hash_value, files in data_to_display.items():
+            # Hashes are kept as raw digest bytes and only formatted as hex for display
+            if isinstance(hash_value, bytes):
+                hash_value = hash_value.hex()
             for file_path in files:
                 file_name = os.path.basename(file_path)
                 rows.append((file_name, hash_value, file_path))
 
-        # Update table size
-        self.table_widget.setRowCount(len(rows))
-
-        # Fill table with rows
-        for i, (file_name, hash_value, file_path) in enumerate(rows):
-            self.table_widget.setItem(i, 0, QTableWidgetItem(str(file_name)))
-            self.table_widget.setItem(i, 1, QTableWidgetItem(str(hash_value)))
-            self.table_widget.setItem(i, 2, QTableWidgetItem(str(file_path)))
+        # The model serves the rows to the view directly and keeps the current sort order
+        self.table_widget.model().set_rows(rows)
 
-    def copy_file(self, src_path, dst_path, buffer_size=1024*1024):
+    def copy_file(self, src_path, dst_path):
         """
         Copies a file from source to destination while preserving metadata.
 
-        Reads and writes in chunks to handle large files efficiently and preserves
-        access and modification times.
+        shutil.copyfile copies the data inside the kernel where it can (sendfile on Linux,
+        fcopyfile on macOS), and copystat then carries over the permission bits and the
+        access and modification times. Only the disabled create_duplicate_folder uses it.
 
         @param src_path: Source file path.
         @param dst_path: Destination file path.
-        @param buffer_size: Size of the read/write buffer in bytes.
         """
-        # Read/write in chunks so you don't blow out memory on large files
-        with open(src_path, "rb") as src, open(dst_path, "wb") as dst:
-            while True:
-                chunk = src.read(buffer_size)
-                if not chunk:
-                    break
-                dst.write(chunk)
-
-        # Preserve original timestamps (access & modification times)
-        stat = os.stat(src_path)
-        os.utime(dst_path, (stat.st_atime, stat.st_mtime))
+        shutil.copyfile(src_path, dst_path)
+        shutil.copystat(src_path, dst_path)
 
     # def create_duplicate_folder(self, duplicates):
     #     """
@@ -1059,6 +2367,22 @@ class MainWindow(QMainWindow):
         
         self.exporter = Exporter(self.config_manager)
 
+        self.tabs.currentChanged.connect(self.on_tab_changed)
+
+    def on_tab_changed(self, index):
+        """
+        Runs the device monitor only while its tab is shown.
+
+        The monitor table is refreshed as soon as the tab is shown again, so hidden tabs
+        cost no partition or disk usage queries.
+
+        @param index: Index of the newly selected tab.
+        """
+        if self.tabs.widget(index) is self.tab_monitor:
+            self.device_monitor.start_monitoring()
+        else:
+            self.device_monitor.stop_monitoring()
+
     def init_monitor_tab(self):
         """
         Initializes the Monitor tab.
@@ -1149,7 +2473,7 @@ class MainWindow(QMainWindow):
         # Connect browse button - FIXED: Move the connection outside the function
         def browse_directory():
             device = device_combo.currentText()
-            mountpoint = next((p.mountpoint for p in psutil.disk_partitions() if p.device == device), None)
+            mountpoint = PartitionCache.mountpoint(device)
             if mountpoint:
                 directory = QFileDialog.getExistingDirectory(self, "Select Directory", mountpoint)
                 if directory:
@@ -1175,7 +2499,7 @@ class MainWindow(QMainWindow):
         @param combo_box: QComboBox to populate with device paths.
         """
         combo_box.clear()
-        partitions = psutil.disk_partitions()
+        partitions = PartitionCache.partitions()
         for partition in partitions:
             combo_box.addItem(partition.device)
 
@@ -1218,9 +2542,8 @@ class MainWindow(QMainWindow):
         btn_find_dupes = QPushButton("Find Duplicate Files")
         dupe_progress = QProgressBar()
 
-        dupe_table = QTableWidget()
-        dupe_table.setColumnCount(3)
-        dupe_table.setHorizontalHeaderLabels(["File Name", "Hash", "Location"])
+        dupe_table = QTableView()
+        dupe_table.setModel(DuplicatesTableModel(dupe_table))
 
         # Set font size for table
         font = dupe_table.font()
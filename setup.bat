@@ -9,7 +9,7 @@ echo Installing Python packages from requirements.txt...
 pip install -r requirements.txt
 
 echo Downloading spaCy English model...
-python -m spacy download en_core_web_sm
+python -m spacy download en_core_web_md
 
 echo Checking Siegfried installation...
 if not exist "Siegfried" (
@@ -239,22 +239,22 @@ else
 fi
 
 echo "Downloading spaCy English model..."
-python -m spacy download en_core_web_sm
+python -m spacy download en_core_web_md
 if [ $? -ne 0 ]; then
-    echo "⚠ Warning: Failed to download spaCy model en_core_web_sm"
+    echo "⚠ Warning: Failed to download spaCy model en_core_web_md"
     echo "Trying again with a clean environment..."
     pip install spacy==3.5.0 --force-reinstall
-    python -m spacy download en_core_web_sm
+    python -m spacy download en_core_web_md
     if [ $? -ne 0 ]; then
         echo "❌ Error: Failed to install spaCy model! Check your network or run manually:"
         echo "    source archivizm_env/bin/activate"
-        echo "    python -m spacy download en_core_web_sm"
+        echo "    python -m spacy download en_core_web_md"
         exit 1
     else
         echo "✅ spaCy model installed successfully on retry!"
     fi
 else
-    echo "✅ spaCy model en_core_web_sm installed successfully!"
+    echo "✅ spaCy model en_core_web_md installed successfully!"
 fi
 
 echo "Checking Siegfried installation..."